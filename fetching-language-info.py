@@ -1,9 +1,13 @@
-import requests
+import asyncio
+import httpx
+import orjson
 import csv
+import gzip
 import os
-from time import sleep
+import socket
 import argparse
 from datetime import datetime
+import time
 import gc
 import logging
 
@@ -15,147 +19,542 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def get_github_repo_languages(org_name, token=None, output_file=None, batch_size=10):
+# httpx logs every request at INFO; keep only its warnings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Transient server errors are retried with exponential backoff
+RETRY_STATUSES = {502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+
+# Disable Nagle's algorithm so small API requests go out immediately, and keep
+# idle pooled connections alive at the TCP level
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Repository fields kept from the REST listing
+REPO_FIELDS = (
+    "name", "languages_url", "html_url", "description", "created_at",
+    "updated_at", "stargazers_count", "forks_count", "private"
+)
+
+def summarize_repo(repo):
     """
-    Extract programming languages used in repositories of a GitHub organization.
+    Reduce a REST repository object to the fields needed for the CSV.
     
     Args:
-        org_name (str): GitHub organization name
-        token (str, optional): GitHub personal access token for authentication
-        output_file (str, optional): Name of the output CSV file
-        batch_size (int): Number of repositories to process at once
+        repo (dict): Repository object from the /orgs/{org}/repos listing
+    
+    Returns:
+        dict: Repository metadata limited to REPO_FIELDS
     """
-    if not output_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"{org_name}_repo_languages_{timestamp}.csv"
+    summary = {field: repo[field] for field in REPO_FIELDS}
+    summary["description"] = summary["description"] or ""
+    return summary
+
+async def request_with_retries(client, method, url, **kwargs):
+    """
+    Issue a request, retrying on connection errors and transient 5xx responses.
     
-    # API endpoint for organization repositories
-    base_url = "https://api.github.com"
-    repos_url = f"{base_url}/orgs/{org_name}/repos"
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client
+        method (str): HTTP method
+        url (str): URL to request
+        **kwargs: Extra arguments passed to httpx.AsyncClient.request
     
-    # Headers for authentication and to reduce response size
-    headers = {
-        "Accept": "application/vnd.github.v3+json"
+    Returns:
+        httpx.Response: Response with its body already read
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        backoff = BACKOFF_FACTOR * (2 ** attempt)
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt == MAX_RETRIES:
+                raise
+            logger.info("Request to %s failed (%s). Retrying in %s seconds.", url, e, backoff)
+            await asyncio.sleep(backoff)
+            continue
+        
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        logger.info("Request to %s returned %d. Retrying in %s seconds.", url, response.status_code, backoff)
+        await asyncio.sleep(backoff)
+
+# Earliest time the next paced request may go out, shared by all concurrent
+# callers of wait_for_rate_limit so the spacing applies to their combined rate
+next_request_time = 0.0
+
+async def wait_for_rate_limit(response, threshold):
+    """
+    Pace requests using the rate-limit headers GitHub returns on every response.
+    
+    No delay is added while the remaining quota is at or above the threshold.
+    Below it, the time left until the quota resets is spread evenly over the
+    remaining requests; once it is exhausted, sleep until the reset. Each
+    caller reserves the next free send slot, so concurrent workers take turns
+    instead of all waiting the same interval and sending together.
+    
+    Args:
+        response (httpx.Response): Response carrying the X-RateLimit-* headers
+        threshold (int): Remaining quota below which requests are spaced out
+    """
+    global next_request_time
+    
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    reset_time = response.headers.get('X-RateLimit-Reset')
+    if remaining is None or reset_time is None:
+        return
+    
+    remaining = int(remaining)
+    if remaining >= threshold:
+        return
+    
+    # The slot is reserved before awaiting, so no lock is needed between workers
+    current_time = time.time()
+    if remaining == 0:
+        send_time = max(int(reset_time) + 1, current_time + 10, next_request_time)
+        next_request_time = send_time
+        logger.info("Rate limit reached. Sleeping for %.1f seconds.", send_time - current_time)
+    else:
+        interval = max(int(reset_time) - current_time, 0) / remaining
+        send_time = max(next_request_time, current_time)
+        next_request_time = send_time + interval
+        if send_time <= current_time:
+            return
+        logger.info("%d requests left before the rate limit resets. Sleeping for %.1f seconds.", remaining, send_time - current_time)
+    await asyncio.sleep(send_time - current_time)
+
+async def fetch_repo_languages(client, repo, rate_limit_threshold):
+    """
+    Fetch the language breakdown for a single repository.
+    
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client
+        repo (dict): Repository metadata containing "languages_url"
+        rate_limit_threshold (int): Remaining quota below which requests are spaced out
+    
+    Returns:
+        dict: Mapping of language name to bytes of code
+    """
+    while True:
+        lang_response = await request_with_retries(client, "GET", repo["languages_url"])
+        
+        # Only back off when GitHub tells us we're out of quota
+        if lang_response.status_code == 403 and lang_response.headers.get('X-RateLimit-Remaining') == '0':
+            reset_time = int(lang_response.headers.get('X-RateLimit-Reset', 0))
+            current_time = int(time.time())
+            sleep_time = max(reset_time - current_time + 1, 10)
+            logger.info("Rate limit reached. Sleeping for %d seconds.", sleep_time)
+            await asyncio.sleep(sleep_time)
+            continue
+        
+        lang_response.raise_for_status()
+        await wait_for_rate_limit(lang_response, rate_limit_threshold)
+        return orjson.loads(lang_response.content)
+
+# Number of fetched repositories between progress file updates
+PROGRESS_SAVE_INTERVAL = 50
+
+def load_progress(state_file):
+    """
+    Load the languages fetched by a previous, interrupted run.
+    
+    Args:
+        state_file (str): Path of the progress file
+    
+    Returns:
+        dict: Mapping of repository name to its languages (empty if there is no progress file)
+    """
+    if not os.path.exists(state_file):
+        return {}
+    
+    try:
+        with open(state_file, "rb") as f:
+            progress = orjson.loads(f.read())["processed"]
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable progress file %s: %s", state_file, e)
+        return {}
+    
+    logger.info("Resuming with languages for %d repositories from %s", len(progress), state_file)
+    return progress
+
+def save_progress(state_file, progress):
+    """
+    Atomically write the languages fetched so far to the progress file.
+    
+    Args:
+        state_file (str): Path of the progress file
+        progress (dict): Mapping of repository name to its languages
+    """
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps({"processed": progress}))
+    os.replace(tmp_file, state_file)
+
+async def languages_worker(client, queue, rate_limit_threshold, progress, state_file):
+    """
+    Fetch languages for repositories taken from a queue until a None sentinel arrives.
+    
+    The result is stored on the repository dict under "_languages"; repositories
+    whose languages could not be fetched are left without it. Successful results
+    are also recorded in progress, which is saved every PROGRESS_SAVE_INTERVAL
+    repositories.
+    
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client
+        queue (asyncio.Queue): Repository dicts waiting for their languages
+        rate_limit_threshold (int): Remaining quota below which requests are spaced out
+        progress (dict): Mapping of repository name to its languages
+        state_file (str): Path of the progress file
+    """
+    while True:
+        repo = await queue.get()
+        if repo is None:
+            return
+        
+        try:
+            repo["_languages"] = await fetch_repo_languages(client, repo, rate_limit_threshold)
+            progress[repo["name"]] = repo["_languages"]
+            if len(progress) % PROGRESS_SAVE_INTERVAL == 0:
+                save_progress(state_file, progress)
+        except Exception as e:
+            logger.warning("Error fetching languages for %s: %s", repo['name'], e)
+            # For memory errors, wait longer and retry
+            if "Cannot allocate memory" in str(e):
+                logger.info("Memory allocation error. Sleeping for 30 seconds to free resources.")
+                gc.collect()  # Force garbage collection
+                await asyncio.sleep(30)
+
+# Repositories and their languages in a single paginated GraphQL query
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_REPOS_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        url
+        description
+        createdAt
+        updatedAt
+        stargazerCount
+        forkCount
+        isPrivate
+        languages(first: 100, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+      }
     }
-    if token:
-        headers["Authorization"] = f"token {token}"
+  }
+}
+"""
+
+async def fetch_repos_graphql(client, org_name, token, rate_limit_threshold):
+    """
+    Fetch repository metadata and languages through the GitHub GraphQL API.
     
-    # Get all repositories (with pagination handling)
+    Each request returns up to 100 repositories with their languages, so no
+    per-repository languages request is needed. The GraphQL API requires
+    authentication.
+    
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client
+        org_name (str): GitHub organization name
+        token (str): GitHub personal access token
+        rate_limit_threshold (int): Remaining quota below which requests are spaced out
+    
+    Returns:
+        list: Repository dicts with their languages under "_languages",
+            or None if the organization could not be fetched
+    """
     all_repos = []
+    cursor = None
     page = 1
-    per_page = 30  # Smaller page size to reduce memory usage
     
-    logger.info(f"Fetching repositories for organization: {org_name}")
+    while True:
+        logger.info("Fetching page %d of repositories", page)
+        payload = {"query": GRAPHQL_REPOS_QUERY, "variables": {"org": org_name, "cursor": cursor}}
+        
+        try:
+            response = await request_with_retries(
+                client, "POST", GRAPHQL_URL, json=payload,
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.error("Error fetching repositories: %s", e)
+            
+            # If we hit rate limits, wait and retry
+            if e.response.status_code == 403:
+                reset_time = int(e.response.headers.get('X-RateLimit-Reset', 0))
+                current_time = int(time.time())
+                sleep_time = max(reset_time - current_time + 1, 60)
+                logger.info("Rate limit reached. Sleeping for %d seconds.", sleep_time)
+                await asyncio.sleep(sleep_time)
+                continue
+            return None
+        except httpx.HTTPError as e:
+            logger.error("Error fetching repositories: %s", e)
+            return None
+        
+        organization = (result.get("data") or {}).get("organization")
+        if organization is None:
+            errors = result.get("errors") or []
+            error_types = {error.get("type") for error in errors}
+            
+            # An exhausted quota comes back as a 200 with a RATE_LIMITED error;
+            # wait for the reset and retry the same cursor to keep earlier pages
+            if "RATE_LIMITED" in error_types or response.headers.get('X-RateLimit-Remaining') == '0':
+                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+                current_time = int(time.time())
+                sleep_time = max(reset_time - current_time + 1, 60)
+                logger.info("Rate limit reached. Sleeping for %d seconds.", sleep_time)
+                await asyncio.sleep(sleep_time)
+                continue
+            
+            for error in errors:
+                logger.error("Error fetching repositories: %s", error.get('message'))
+            if "NOT_FOUND" in error_types:
+                logger.error("Organization '%s' not found.", org_name)
+            return None
+        
+        repositories = organization["repositories"]
+        for repo in repositories["nodes"]:
+            all_repos.append({
+                "name": repo["name"],
+                "html_url": repo["url"],
+                "description": repo["description"] or "",
+                "created_at": repo["createdAt"],
+                "updated_at": repo["updatedAt"],
+                "stargazers_count": repo["stargazerCount"],
+                "forks_count": repo["forkCount"],
+                "private": repo["isPrivate"],
+                "_languages": {
+                    edge["node"]["name"]: edge["size"]
+                    for edge in repo["languages"]["edges"]
+                }
+            })
+        
+        logger.info("Fetched %d repositories", len(repositories['nodes']))
+        
+        # Check rate limits
+        await wait_for_rate_limit(response, rate_limit_threshold)
+        
+        if not repositories["pageInfo"]["hasNextPage"]:
+            break
+        cursor = repositories["pageInfo"]["endCursor"]
+        page += 1
+    
+    return all_repos
+
+async def list_repos_rest(client, org_name, rate_limit_threshold, queue, progress):
+    """
+    Page through an organization's repositories with the GitHub REST API.
+    
+    Each repository is put on the queue as soon as its page arrives, so
+    language requests can start before the listing is complete. Repositories
+    already in progress reuse the saved languages and are not queued.
+    
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client
+        org_name (str): GitHub organization name
+        rate_limit_threshold (int): Remaining quota below which requests are spaced out
+        queue (asyncio.Queue): Receives repository dicts for the language workers
+        progress (dict): Mapping of repository name to languages from a previous run
+    
+    Returns:
+        list: Repository dicts in listing order, or None if the organization
+            could not be fetched
+    """
+    repos_url = f"https://api.github.com/orgs/{org_name}/repos"
+    
+    # Get all repositories (with pagination handling)
+    all_repos = []
+    page = 1
+    per_page = 100  # Maximum page size allowed by the API
     
-    # First, just collect repository metadata (not languages yet)
     try:
         while True:
             params = {"page": page, "per_page": per_page}
-            logger.info(f"Fetching page {page} of repositories")
+            logger.info("Fetching page %d of repositories", page)
             
             try:
-                response = requests.get(repos_url, headers=headers, params=params, timeout=30)
+                response = await request_with_retries(client, "GET", repos_url, params=params)
                 response.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error fetching repositories: {e}")
-                if hasattr(e.response, 'status_code') and e.response.status_code == 404:
-                    logger.error(f"Organization '{org_name}' not found.")
-                    return
+                repos_page = orjson.loads(response.content)
+            except httpx.HTTPStatusError as e:
+                logger.error("Error fetching repositories: %s", e)
+                if e.response.status_code == 404:
+                    logger.error("Organization '%s' not found.", org_name)
+                    return None
                 
                 # If we hit rate limits, wait and retry
-                if hasattr(e.response, 'status_code') and e.response.status_code == 403:
+                if e.response.status_code == 403:
                     reset_time = int(e.response.headers.get('X-RateLimit-Reset', 0))
-                    current_time = int(datetime.now().timestamp())
+                    current_time = int(time.time())
                     sleep_time = max(reset_time - current_time + 1, 60)
-                    logger.info(f"Rate limit reached. Sleeping for {sleep_time} seconds.")
-                    sleep(sleep_time)
+                    logger.info("Rate limit reached. Sleeping for %d seconds.", sleep_time)
+                    await asyncio.sleep(sleep_time)
                     continue
                 
+                raise
+            except httpx.HTTPError as e:
+                logger.error("Error fetching repositories: %s", e)
+                
                 # For memory errors, wait longer and retry
                 if "Cannot allocate memory" in str(e):
                     logger.info("Memory allocation error. Sleeping for 60 seconds to free resources.")
                     gc.collect()  # Force garbage collection
-                    sleep(60)
+                    await asyncio.sleep(60)
                     continue
-                    
+                
                 raise
             
-            repos_page = response.json()
             if not repos_page:
                 break
                 
             # Only store necessary data to save memory
             for repo in repos_page:
-                all_repos.append({
-                    "name": repo["name"],
-                    "languages_url": repo["languages_url"],
-                    "html_url": repo["html_url"],
-                    "description": repo["description"] or "",
-                    "created_at": repo["created_at"],
-                    "updated_at": repo["updated_at"],
-                    "stargazers_count": repo["stargazers_count"],
-                    "forks_count": repo["forks_count"],
-                    "private": repo["private"]
-                })
+                summary = summarize_repo(repo)
+                all_repos.append(summary)
+                if summary["name"] in progress:
+                    summary["_languages"] = progress[summary["name"]]
+                else:
+                    await queue.put(summary)
             
-            logger.info(f"Fetched {len(repos_page)} repositories")
+            logger.info("Fetched %d repositories", len(repos_page))
             page += 1
             
-            # Check rate limits
-            if response.headers.get('X-RateLimit-Remaining') == '0':
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                current_time = int(datetime.now().timestamp())
-                sleep_time = max(reset_time - current_time + 1, 10)
-                logger.info(f"Rate limit reached. Sleeping for {sleep_time} seconds.")
-                sleep(sleep_time)
-            else:
-                # Small delay between requests
-                sleep(1)
+            # The last page has no rel="next" link, so stop without requesting an empty page
+            if "next" not in response.links:
+                break
             
-            # Force garbage collection after each page
-            gc.collect()
+            # Check rate limits
+            await wait_for_rate_limit(response, rate_limit_threshold)
     
     except Exception as e:
-        logger.error(f"Error fetching repositories: {e}")
+        logger.error("Error fetching repositories: %s", e)
+        return None
+    
+    return all_repos
+
+async def fetch_repos_rest(client, org_name, batch_size, state_file):
+    """
+    Fetch repository metadata and languages through the GitHub REST API.
+    
+    The repository listing feeds a queue consumed by batch_size workers, each
+    requesting one repository's languages at a time while later pages are
+    still being fetched. Languages already recorded in the progress file are
+    not requested again, and the file is updated before returning so an
+    interrupted run can be resumed.
+    
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client
+        org_name (str): GitHub organization name
+        batch_size (int): Number of repositories to process at once
+        state_file (str): Path of the progress file
+    
+    Returns:
+        list: Repository dicts with their languages under "_languages",
+            or None if the organization could not be fetched
+    """
+    progress = load_progress(state_file)
+    
+    # A bounded queue keeps the listing at most a couple of batches ahead
+    queue = asyncio.Queue(maxsize=batch_size * 2)
+    workers = [
+        asyncio.create_task(languages_worker(client, queue, batch_size, progress, state_file))
+        for _ in range(batch_size)
+    ]
+    
+    try:
+        all_repos = await list_repos_rest(client, org_name, batch_size, queue, progress)
+        if all_repos is None:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            return None
+        
+        # One sentinel per worker once every repository has been queued
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        if progress:
+            save_progress(state_file, progress)
+    
+    return all_repos
+
+async def get_github_repo_languages(org_name, token=None, output_file=None, batch_size=10):
+    """
+    Extract programming languages used in repositories of a GitHub organization.
+    
+    With a token the GraphQL API is used, fetching repositories together with
+    their languages; anonymous runs fall back to the REST API.
+    
+    Args:
+        org_name (str): GitHub organization name
+        token (str, optional): GitHub personal access token for authentication
+        output_file (str, optional): Name of the output CSV file; it is
+            gzip-compressed and ".gz" is appended if missing
+        batch_size (int): Number of repositories to process at once
+    """
+    if not output_file:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"{org_name}_repo_languages_{timestamp}.csv"
+    
+    # The percentage columns are mostly zeros, so the CSV compresses very well
+    if not output_file.endswith(".gz"):
+        output_file = f"{output_file}.gz"
+    
+    # Languages fetched so far are kept here until the CSV has been written; it is
+    # keyed on the organization so a rerun resumes even with a new timestamped output
+    state_file = f"{org_name}.progress.json"
+    
+    # Headers for authentication and to reduce response size
+    headers = {
+        "Accept": "application/vnd.github.v3+json"
+    }
+    if token:
+        headers["Authorization"] = f"token {token}"
+    
+    logger.info("Fetching repositories for organization: %s", org_name)
+    
+    # One HTTP/2 client for the whole run: concurrent requests are multiplexed
+    # as streams over a shared TLS connection instead of one request per socket.
+    # The pool never drops below 32 connections so HTTP/1.1 fallbacks don't queue
+    pool_size = max(batch_size, 32)
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size, keepalive_expiry=60)
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, socket_options=SOCKET_OPTIONS)
+    async with httpx.AsyncClient(transport=transport, headers=headers, timeout=30) as client:
+        if token:
+            all_repos = await fetch_repos_graphql(client, org_name, token, batch_size)
+        else:
+            all_repos = await fetch_repos_rest(client, org_name, batch_size, state_file)
+    
+    if all_repos is None:
         return
     
     total_repos = len(all_repos)
-    logger.info(f"Found {total_repos} repositories in total.")
+    logger.info("Found %d repositories in total.", total_repos)
     
-    # Gather languages for all repositories in batches first
-    # The CSV is written in a later pass once the language list is complete
+    # Collect all languages across repositories
     all_languages = set()
-    
-    # First pass: collect all languages across repositories
-    logger.info("First pass: collecting all languages")
-    for i in range(0, total_repos, batch_size):
-        batch = all_repos[i:i+batch_size]
-        logger.info(f"Processing batch {i//batch_size + 1}/{(total_repos-1)//batch_size + 1} for language discovery")
-        
-        for repo in batch:
-            try:
-                lang_response = requests.get(repo["languages_url"], headers=headers, timeout=30)
-                lang_response.raise_for_status()
-                languages = lang_response.json()
-                all_languages.update(languages.keys())
-                
-                # Small delay between requests
-                sleep(0.5)
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Error fetching languages for {repo['name']}: {e}")
-                # For memory errors, wait longer and retry
-                if "Cannot allocate memory" in str(e):
-                    logger.info("Memory allocation error. Sleeping for 30 seconds to free resources.")
-                    gc.collect()  # Force garbage collection
-                    sleep(30)
-                continue
-        
-        # Force garbage collection after each batch
-        gc.collect()
+    for repo in all_repos:
+        if "_languages" in repo:
+            all_languages.update(repo["_languages"])
     
     # Sort languages alphabetically
     all_languages = sorted(all_languages)
     
+    # Column offset of each language among the percentage columns
+    lang_index = {lang: i for i, lang in enumerate(all_languages)}
+    
     # Prepare CSV headers
     headers_csv = [
         "Repository", "URL", "Description", "Primary Language", 
@@ -166,77 +565,69 @@ def get_github_repo_languages(org_name, token=None, output_file=None, batch_size
     for lang in all_languages:
         headers_csv.append(f"{lang} (%)")
     
-    logger.info(f"Writing data to {output_file}")
+    logger.info("Writing data to %s", output_file)
     
-    # Open CSV file for writing
-    with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
+    # Open CSV file for writing, compressing on the fly
+    with gzip.open(output_file, "wt", newline="", encoding="utf-8", compresslevel=3) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(headers_csv)
         
-        # Second pass: process repositories in batches
+        # Write rows from the languages collected above
+        batch_data = []
         for i in range(0, total_repos, batch_size):
             batch = all_repos[i:i+batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(total_repos-1)//batch_size + 1} for CSV writing")
+            logger.info("Processing batch %d/%d for CSV writing", i//batch_size + 1, (total_repos-1)//batch_size + 1)
             
-            batch_data = []
             for repo in batch:
-                try:
-                    lang_response = requests.get(repo["languages_url"], headers=headers, timeout=30)
-                    lang_response.raise_for_status()
-                    languages = lang_response.json()
-                    
-                    # Calculate percentages
-                    total_bytes = sum(languages.values())
-                    languages_with_percentages = {}
-                    for lang, bytes_count in languages.items():
-                        percentage = round(bytes_count / total_bytes * 100, 2) if total_bytes > 0 else 0
-                        languages_with_percentages[lang] = percentage
-                    
-                    # Find primary language (highest percentage)
-                    primary_language = max(languages.items(), key=lambda x: x[1])[0] if languages else "None"
-                    
-                    # Create row data
-                    row = [
-                        repo["name"],
-                        repo["html_url"],
-                        repo["description"],
-                        primary_language,
-                        repo["created_at"],
-                        repo["updated_at"],
-                        repo["stargazers_count"],
-                        repo["forks_count"],
-                        "Yes" if repo["private"] else "No"
-                    ]
-                    
-                    # Add language percentages
-                    for lang in all_languages:
-                        percentage = languages_with_percentages.get(lang, 0)
-                        row.append(percentage)
-                    
-                    writer.writerow(row)
-                    
-                    # Small delay between requests
-                    sleep(0.5)
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"Error fetching languages for {repo['name']}: {e}")
-                    # For memory errors, wait longer and retry
-                    if "Cannot allocate memory" in str(e):
-                        logger.info("Memory allocation error. Sleeping for 30 seconds to free resources.")
-                        gc.collect()  # Force garbage collection
-                        sleep(30)
+                # Repositories whose languages could not be fetched are skipped
+                languages = repo.get("_languages")
+                if languages is None:
                     continue
+                
+                # Calculate percentages straight into their columns; languages
+                # the repository doesn't use stay at 0
+                total_bytes = sum(languages.values())
+                percentages = [0] * len(all_languages)
+                if total_bytes > 0:
+                    for lang, bytes_count in languages.items():
+                        percentages[lang_index[lang]] = round(bytes_count / total_bytes * 100, 2)
+                
+                # Find primary language (highest percentage)
+                primary_language = max(languages, key=languages.get) if languages else "None"
+                
+                # Create row data
+                row = [
+                    repo["name"],
+                    repo["html_url"],
+                    repo["description"],
+                    primary_language,
+                    repo["created_at"],
+                    repo["updated_at"],
+                    repo["stargazers_count"],
+                    repo["forks_count"],
+                    "Yes" if repo["private"] else "No"
+                ]
+                
+                # Add language percentages
+                row.extend(percentages)
+                
+                batch_data.append(row)
             
-            # Force garbage collection after each batch
-            gc.collect()
-            csvfile.flush()  # Flush data to disk after each batch
+            # Write the whole batch at once
+            writer.writerows(batch_data)
+            batch_data.clear()
+    
+    # The run is complete, so there is nothing left to resume
+    if os.path.exists(state_file):
+        os.remove(state_file)
     
-    logger.info(f"Data exported successfully to {output_file}")
+    logger.info("Data exported successfully to %s", output_file)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Extract programming languages from GitHub organization repositories")
     parser.add_argument("org_name", help="GitHub organization name")
     parser.add_argument("--token", "-t", help="GitHub personal access token")
-    parser.add_argument("--output", "-o", help="Output CSV file name")
+    parser.add_argument("--output", "-o", help="Output CSV file name, gzip-compressed with a .gz suffix")
     parser.add_argument("--batch-size", "-b", type=int, default=10, help="Number of repositories to process at once")
     
     args = parser.parse_args()
@@ -245,4 +636,4 @@ if __name__ == "__main__":
     if not args.token and "GITHUB_TOKEN" in os.environ:
         args.token = os.environ["GITHUB_TOKEN"]
     
-    get_github_repo_languages(args.org_name, args.token, args.output, args.batch_size)
+    asyncio.run(get_github_repo_languages(args.org_name, args.token, args.output, args.batch_size))